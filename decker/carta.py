@@ -1,8 +1,10 @@
+import random
 import sys
+from dataclasses import dataclass
 from enum import Enum, auto
-from typing import List, Optional, Tuple, Union
+from typing import List, Optional, Tuple
 
-from deck import Card, Deck, PlayingCard, PlayingCardDeck, Suit, shuffle
+from deck import Card, Deck, PlayingCard, PlayingCardDeck, Suit
 
 
 class Direction(Enum):
@@ -22,29 +24,50 @@ class Direction(Enum):
         return self.name
 
 
+# (rows, columns) to move by in each direction.
+_DELTAS = {
+    Direction.N: (-1, 0),
+    Direction.NW: (-1, -1),
+    Direction.NE: (-1, 1),
+    Direction.S: (1, 0),
+    Direction.SW: (1, -1),
+    Direction.SE: (1, 1),
+    Direction.E: (0, 1),
+    Direction.W: (0, -1),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class CartaGrid:
+    # Bit `i * columns + j` of the mask is set if the slot at row i, column j
+    # should hold a card.
+    rows: int
+    columns: int
+    mask: int
+
+    def __post_init__(self) -> None:
+        if not all(isinstance(field, int) for field in (self.rows, self.columns, self.mask)):
+            raise ValueError(f'Grid rows, columns and mask must be ints: {self}')
+        if not (self.rows > 0 and self.columns > 0):
+            raise ValueError(f'Grid must have at least one row and column: {self}')
+        if not 0 <= self.mask < (1 << (self.rows * self.columns)):
+            raise ValueError(f'Grid mask does not fit the grid: {self}')
+        # One slot for the starting card and one for the goal card.
+        if self.mask.bit_count() < 2:
+            raise ValueError(f'Grid must have at least two slots: {self}')
+
+
 class CartaBoard:
-    CartaGrid = List[List[Union[bool, Card]]]
+    CartaGrid = CartaGrid
 
     @staticmethod
     def create_grid(rows: int, columns: int) -> CartaGrid:
-        grid = list()
-        for _i in range(rows):
-            row = list()
-            for _j in range(columns):
-                row.append(True)
-            grid.append(row)
-        return grid
+        return CartaGrid(rows, columns, (1 << (rows * columns)) - 1)
 
     @classmethod
     def is_valid_grid(cls, grid: CartaGrid) -> bool:
-        first_row_len = len(grid[0])
-        for row in grid:
-            if len(row) != first_row_len:
-                return False
-            for elem in row:
-                if not isinstance(elem, bool):
-                    return False
-        return True
+        # CartaGrid checks its own invariants when it's constructed.
+        return isinstance(grid, CartaGrid)
 
     def __init__(
         self,
@@ -56,7 +79,8 @@ class CartaBoard:
     ) -> None:
         if not self.is_valid_grid(grid):
             raise ValueError(f'Invalid grid: {grid}')
-        self.grid = grid
+        self.rows, self.columns, self.occ_mask = grid.rows, grid.columns, grid.mask
+        self.cards: List[Optional[Card]] = [None] * (self.rows * self.columns)
         self.goal_card = goal_card
         self.starting_card = starting_card
         self.starting_card.is_faceup = True
@@ -69,6 +93,13 @@ class CartaBoard:
             ]
         else:
             self.allowed_diections = allowed_directions
+        # Accepted (upper-cased) input -> Direction, limited to the allowed
+        # directions plus the ways of quitting. Built once here, so changing
+        # allowed_diections after construction doesn't affect parsing.
+        self._direction_index = {d.name: d for d in self.allowed_diections}
+        self._direction_index.update(
+            {name: Direction.Q for name in ('Q', 'QUIT', 'EXIT')}
+        )
         self._build(deck)
 
     def _build(self, deck: Deck):
@@ -76,24 +107,33 @@ class CartaBoard:
         deck.remove(self.goal_card)
         deck.shuffle()
         grid_cards: List[Card] = deck.deal((self._available_slots_in_grid() - 2))
+        # The dealt cards are already shuffled; only the goal card needs a
+        # random position, so swap it into one.
         grid_cards.append(self.goal_card)
-        shuffle(grid_cards)
-        for i in range(len(self.grid)):
-            for j in range(len(self.grid[i])):
-                if self.grid[i][j] is True:
-                    if grid_cards:
-                        self.grid[i][j] = grid_cards.pop()
-                    else:
-                        self.grid[i][j] = self.starting_card
-                        self.player_location = (i, j)
+        r = random.randint(0, len(grid_cards) - 1)
+        grid_cards[-1], grid_cards[r] = grid_cards[r], grid_cards[-1]
+        *card_slots, start_slot = self._occupied_slots()
+        for idx, card in zip(card_slots, reversed(grid_cards), strict=True):
+            self.cards[idx] = card
+        self.cards[start_slot] = self.starting_card
+        self.player_location = divmod(start_slot, self.columns)
 
     def _available_slots_in_grid(self) -> int:
-        num_true = 0
-        for row in self.grid:
-            for elem in row:
-                if elem is True:
-                    num_true += 1
-        return num_true
+        return self.occ_mask.bit_count()
+
+    def _occupied_slots(self) -> List[int]:
+        # Walk the set bits of the mask, lowest first, rather than testing
+        # every slot on the board.
+        slots = []
+        mask = self.occ_mask
+        while mask:
+            low_bit = mask & -mask
+            slots.append(low_bit.bit_length() - 1)
+            mask ^= low_bit
+        return slots
+
+    def _card_at(self, i: int, j: int) -> Optional[Card]:
+        return self.cards[i * self.columns + j]
 
     def start(self) -> None:
         self.show()
@@ -112,8 +152,7 @@ class CartaBoard:
                 )
                 if self._is_valid_move(direction):
                     self.player_location = self._new_location(direction)
-                    i, j = self.player_location
-                    self.grid[i][j].is_faceup = True
+                    self._card_at(*self.player_location).is_faceup = True
             except ValueError as e:
                 print(e)
                 continue
@@ -122,48 +161,42 @@ class CartaBoard:
         self.show_player_location()
 
     def _parse_input_direction(self, input: str) -> Enum:
-        try:
-            direction = Direction[input.upper()]
-            if direction == Direction.Q:
-                print('Goodbye!')
-                sys.exit(0)
-            assert direction in self.allowed_diections
-            return direction
-        except (KeyError, AssertionError):
+        direction = self._direction_index.get(input.upper())
+        if direction is None:
             raise ValueError(f'Direction must be one of: {self.allowed_diections}')
+        if direction is Direction.Q:
+            print('Goodbye!')
+            sys.exit(0)
+        return direction
 
     def _new_location(self, direction: Enum) -> Tuple[int, int]:
-        ns, we = self.player_location
-        if direction == Direction.N:
-            ns -= 1
-        elif direction == Direction.S:
-            ns += 1
-        elif direction == Direction.W:
-            we -= 1
-        elif direction == Direction.E:
-            we += 1
-        else:
-            # TODO: NW, NE, SE, SW
+        delta = _DELTAS.get(direction)
+        if delta is None:
             raise NotImplementedError
-        return (ns, we)
+        ns, we = self.player_location
+        return (ns + delta[0], we + delta[1])
 
     def _is_valid_move(self, direction: Enum) -> bool:
         ns, we = self._new_location(direction)
-        try:
-            self.grid[ns][we]
-            assert (ns >= 0) and (we >= 0)
-            assert isinstance(self.grid[ns][we], Card)
-        except (IndexError, AssertionError):
+        if (
+            not (0 <= ns < self.rows and 0 <= we < self.columns)
+            or not isinstance(self._card_at(ns, we), Card)
+        ):
             raise ValueError("You can't go off the map.")
         return True
 
     def show(self) -> None:
         # TODO: How to represent grids with empty spaces?
-        print('\n'.join(''.join(str(i).center(5) for i in row) for row in self.grid))
+        # Render from self.cards on every call so the output can't drift from
+        # the board; each card's face-up string is already cached.
+        cells = [str(card).center(5) for card in self.cards]
+        print('\n'.join(
+            ''.join(cells[i * self.columns:(i + 1) * self.columns])
+            for i in range(self.rows)
+        ))
 
     def show_player_location(self) -> None:
-        i, j = self.player_location
-        print(f'You are at: {self.grid[i][j]}')
+        print(f'You are at: {self._card_at(*self.player_location)}')
 
 
 if __name__ == "__main__":
@@ -1,27 +1,30 @@
 import random
-from collections import deque
 from enum import Enum, auto
-from functools import total_ordering
 from typing import Dict, List, Optional, Union
 
 
 ### HELPER FUNCTIONS ##########################################################
 
-# TODO: Maybe move this back to Deck but allow the creating of a base Deck with
-# the cards of one's choosing (it got moved out to allow shuffling of a list of
-# cards in `carta.py`)?
-def shuffle(lst: Union[list, deque]) -> None:
-    # Move through the list of cards backwards: start at last card, stop at
-    # first card, -1 step.
-    for i in range(len(lst) - 1, 0, -1):
-        # Pick a random number to the left of our index position.
-        r = random.randint(0, i)
-        # Swap the two cards.
-        lst[i], lst[r] = lst[r], lst[i]
+# Kept at module level so lists of cards outside a Deck can be shuffled too.
+def shuffle(lst: list) -> None:
+    # random.shuffle does the same in-place Fisher-Yates shuffle, but the loop
+    # runs in C.
+    random.shuffle(lst)
 
 
 ### SUITS #####################################################################
 
+_SUIT_GLYPHS = {
+    'Clubs': '\u2663',
+    'Diamonds': '\u2666',
+    'Hearts': '\u2665',
+    'Spades': '\u2660',
+    'Wands': '\u269A',
+    'Coins': '\u235F',  # Alternative: '\u272A'
+    'Cups': '\u222A',
+    'Swords': '\u2694',
+}
+
 
 class Color(Enum):
     RED = auto()
@@ -31,62 +34,108 @@ class Color(Enum):
         return self.name.capitalize()
 
 
-@total_ordering
+_SUIT_COLORS = {
+    'Clubs': Color.BLACK,
+    'Diamonds': Color.RED,
+    'Hearts': Color.RED,
+    'Spades': Color.BLACK,
+}
+
+
 class Suit:
-    def __init__(
-        self,
+    __slots__ = ('_name', '_value', '_color', '_short_name', '_repr')
+
+    # Suits are interned: constructing the same suit twice returns the same
+    # instance, so ad hoc `Suit('Hearts')` calls don't redo the set-up below.
+    # Because instances are shared, their fields are read-only.
+    _cache: Dict[tuple, 'Suit'] = dict()
+
+    def __new__(
+        cls,
         name: Optional[str],
         value: Optional[int] = None,
         color: Optional[Enum] = None
-    ) -> None:
+    ) -> 'Suit':
         name = name.capitalize() if isinstance(name, str) else None
         if not color:
-            if name in {'Diamonds', 'Hearts'}:
-                color = Color.RED
-            elif name in {'Clubs', 'Spades'}:
-                color = Color.BLACK
+            color = _SUIT_COLORS.get(name)
         value = int(value) if isinstance(value, int) else 0
 
-        self.name = name
-        self.value = value
-        self.color = color
-        self.short_name = self._shorten_name()
+        key = (cls, name, value, color)
+        self = cls._cache.get(key)
+        if self is not None:
+            return self
+        self = super().__new__(cls)
+        self._name = name
+        self._value = value
+        self._color = color
+        self._short_name = _SUIT_GLYPHS.get(name)
+        self._repr = f'{name} ({value}), {color} {self._short_name}'
+        cls._cache[key] = self
+        return self
+
+    def __reduce__(self):
+        # Go back through __new__ so copies and unpickled suits are interned.
+        return (type(self), (self._name, self._value, self._color))
+
+    @property
+    def name(self) -> Optional[str]:
+        return self._name
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    @property
+    def color(self) -> Optional[Enum]:
+        return self._color
+
+    @property
+    def short_name(self) -> Optional[str]:
+        return self._short_name
 
     def __repr__(self) -> str:
-        return f'{self.name} ({self.value}), {self.color} {self.short_name}'
-
-    def _shorten_name(self) -> Union[str, None]:
-        conversion = {
-            'Clubs': '\u2663',
-            'Diamonds': '\u2666',
-            'Hearts': '\u2665',
-            'Spades': '\u2660',
-            'Wands': '\u269A',
-            'Coins': '\u235F',  # Alternative: '\u272A'
-            'Cups': '\u222A',
-            'Swords': '\u2694',
-        }
-        if self.name:
-            return conversion.get(self.name)
-
-    def _is_valid_operand(self, other):
-        return hasattr(other, "value")
+        return self._repr
 
     def __eq__(self, other):
-        if not self._is_valid_operand(other):
+        if self is other:
+            return True
+        if not isinstance(other, Suit):
             return NotImplemented
         return self.value == other.value
 
+    def __ne__(self, other):
+        if not isinstance(other, Suit):
+            return NotImplemented
+        return self.value != other.value
+
     def __lt__(self, other):
-        if not self._is_valid_operand(other):
+        if not isinstance(other, Suit):
             return NotImplemented
         return self.value < other.value
 
+    def __le__(self, other):
+        if not isinstance(other, Suit):
+            return NotImplemented
+        return self.value <= other.value
+
+    def __gt__(self, other):
+        if not isinstance(other, Suit):
+            return NotImplemented
+        return self.value > other.value
+
+    def __ge__(self, other):
+        if not isinstance(other, Suit):
+            return NotImplemented
+        return self.value >= other.value
+
 
 ### CARDS #####################################################################
 
 
 class Card:
+    __slots__ = ('is_faceup',)
+
     def __init__(self) -> None:
         self.is_faceup = False
 
@@ -97,25 +146,54 @@ class Card:
         print(self)
 
 
-@total_ordering
 class PlayingCard(Card):
+    __slots__ = ('_suit', '_value', '_char_value', '_faceup_str')
+
     def __init__(
         self,
         suit: Suit,
         value: int,
         court_mapping: Optional[Dict[int, str]] = None
     ) -> None:
-        self.suit = suit
-        self.value = int(value)
-        self.char_value = self._value_to_char(court_mapping)
+        self._suit = suit
+        self._value = int(value)
+        self._char_value = self._value_to_char(court_mapping)
+        # Build the face-up string once instead of on every redraw of the
+        # board; the setters below rebuild it if the card changes.
+        self._faceup_str = self._get_str()
         super().__init__()
 
+    @property
+    def suit(self) -> Suit:
+        return self._suit
+
+    @suit.setter
+    def suit(self, suit: Suit) -> None:
+        self._suit = suit
+        self._faceup_str = self._get_str()
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    @value.setter
+    def value(self, value: int) -> None:
+        self._value = int(value)
+        self._faceup_str = self._get_str()
+
+    @property
+    def char_value(self) -> Optional[str]:
+        return self._char_value
+
+    @char_value.setter
+    def char_value(self, char_value: Optional[str]) -> None:
+        self._char_value = char_value
+        self._faceup_str = self._get_str()
+
     def __repr__(self) -> str:
         # TODO: Maybe move the "show card back" logic somewhere else and have
         # repr always show the object? Maybe a display method?
-        if not self.is_faceup:
-            return 'XX'
-        return self._get_str()
+        return 'XX' if not self.is_faceup else self._faceup_str
 
     def _get_str(self) -> str:
         value = self.char_value if self.char_value else str(self.value)
@@ -130,39 +208,58 @@ class PlayingCard(Card):
             return value
 
     def show_reverse(self) -> None:
-        print(self._get_str())
+        print(self._faceup_str)
 
     def _value_to_char(self, court_mapping: Optional[Dict[int, str]]) -> Union[str, None]:
         if not court_mapping:
             court_mapping = dict()
         return court_mapping.get(self.value)
 
-    def _is_valid_operand(self, other) -> bool:
-        return (hasattr(other, "suit") and
-                hasattr(other, "value"))
-
     def __eq__(self, other) -> bool:
-        if not self._is_valid_operand(other):
+        if not isinstance(other, PlayingCard):
             return NotImplemented
         return ((self.value, self.suit.value) ==
                 (other.value, other.suit.value))
 
+    def __ne__(self, other) -> bool:
+        if not isinstance(other, PlayingCard):
+            return NotImplemented
+        return ((self.value, self.suit.value) !=
+                (other.value, other.suit.value))
+
     def __lt__(self, other) -> bool:
-        if not self._is_valid_operand(other):
+        if not isinstance(other, PlayingCard):
             return NotImplemented
         return ((self.value, self.suit.value) <
                 (other.value, other.suit.value))
 
+    def __le__(self, other) -> bool:
+        if not isinstance(other, PlayingCard):
+            return NotImplemented
+        return ((self.value, self.suit.value) <=
+                (other.value, other.suit.value))
+
+    def __gt__(self, other) -> bool:
+        if not isinstance(other, PlayingCard):
+            return NotImplemented
+        return ((self.value, self.suit.value) >
+                (other.value, other.suit.value))
+
+    def __ge__(self, other) -> bool:
+        if not isinstance(other, PlayingCard):
+            return NotImplemented
+        return ((self.value, self.suit.value) >=
+                (other.value, other.suit.value))
+
 
 ### DECK ######################################################################
 
 
 class Deck:
     def __init__(self) -> None:
-        # TODO: Is a deque really the best data structure for this?
-        # Concerns: shuffling involves a lot of look-ups by index, which
-        # approximate O(n) toward the middle of the deque.
-        self.cards = deque()
+        # A list rather than a deque: shuffling involves a lot of look-ups by
+        # index, which approximate O(n) toward the middle of a deque.
+        self.cards: List[Card] = []
 
     def __len__(self) -> int:
         return len(self.cards)
@@ -180,10 +277,14 @@ class Deck:
         self.cards[-1].show()
 
     def deal(self, n: int = 1) -> list:
-        cards = []
-        while n > 0:
-            cards.append(self.cards.popleft())
-            n -= 1
+        # IndexError, like the popleft-based deal it replaced; checked up front
+        # so the deck is left untouched.
+        if n > len(self.cards):
+            raise IndexError(f'Cannot deal {n} cards from a deck of {len(self.cards)}')
+        # Clamp so a negative n deals nothing rather than slicing from the end.
+        n = max(n, 0)
+        cards = self.cards[:n]
+        del self.cards[:n]
         return cards
 
     def take(self, card: Card) -> Union[Card, None]:
@@ -192,7 +293,7 @@ class Deck:
         except ValueError:
             return None
         found_card = self.cards[i]
-        self.remove(card)
+        del self.cards[i]
         return found_card
 
     def remove(self, card: Card) -> None:
@@ -234,9 +335,11 @@ class PlayingCardDeck(Deck):
     def _build(self):
         min_range = 2 if self.aces_high else 1
         max_range = min_range + 13
-        for suit in self.suits:
-            for value in range(min_range, max_range):
-                self.cards.append(PlayingCard(suit, value, self.court_mapping))
+        self.cards = [
+            PlayingCard(suit, value, self.court_mapping)
+            for suit in self.suits
+            for value in range(min_range, max_range)
+        ]
         if self.include_jokers:
             jokers = list()
             joker_colors = [Color.RED, Color.BLACK]
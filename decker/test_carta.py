@@ -0,0 +1,168 @@
+import io
+import sys
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+from carta import CartaBoard, CartaGrid, Direction
+from deck import Card, PlayingCard, PlayingCardDeck, Suit
+
+
+class CartaGridTest(unittest.TestCase):
+    def test_create_grid_fills_every_slot(self):
+        grid = CartaBoard.create_grid(4, 6)
+        self.assertEqual(grid, CartaGrid(4, 6, (1 << 24) - 1))
+        self.assertIs(CartaBoard.CartaGrid, CartaGrid)
+
+    def test_invalid_grids_raise(self):
+        for args in [
+            (0, 3, 0),
+            (2, 2, 1 << 4),
+            (2, 2, 0),
+            (2, 2, 0b0100),
+            (2.0, 3, 63),
+        ]:
+            with self.subTest(args=args), self.assertRaises(ValueError):
+                CartaGrid(*args)
+
+
+class CartaBoardTest(unittest.TestCase):
+    def _board(self, grid):
+        goal_card = PlayingCard(Suit('Hearts'), 2)
+        starting_card = PlayingCard(Suit('Clubs'), 2)
+        return CartaBoard(PlayingCardDeck(aces_high=False), grid, goal_card, starting_card)
+
+    def test_every_occupied_slot_gets_a_card(self):
+        board = self._board(CartaGrid(3, 3, 0b101010101))
+        for idx, card in enumerate(board.cards):
+            self.assertEqual(isinstance(card, Card), bool(board.occ_mask >> idx & 1))
+        self.assertIs(board.cards[8], board.starting_card)
+        self.assertEqual(board.player_location, (2, 2))
+
+    def _shown(self, board):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            board.show()
+        return out.getvalue()
+
+    def test_show_reflects_current_cards(self):
+        board = self._board(CartaGrid(2, 2, 0b1111))
+        self.assertEqual(self._shown(board), '  XX   XX \n  XX   2\u2663 \n')
+        board.cards[0].flip()
+        self.assertEqual(self._shown(board).split()[0], repr(board.cards[0]))
+        board.cards[1] = None
+        self.assertEqual(self._shown(board).splitlines()[0][5:], 'None'.center(5))
+
+    def test_grid_larger_than_deck_raises(self):
+        with self.assertRaises(IndexError):
+            self._board(CartaBoard.create_grid(8, 8))
+
+
+
+ALL_DIRECTIONS = [
+    Direction.N, Direction.NW, Direction.NE, Direction.S,
+    Direction.SW, Direction.SE, Direction.E, Direction.W,
+]
+
+
+class CartaMoveTest(unittest.TestCase):
+    def _board(self, grid):
+        goal_card = PlayingCard(Suit('Hearts'), 2)
+        starting_card = PlayingCard(Suit('Clubs'), 2)
+        return CartaBoard(
+            PlayingCardDeck(aces_high=False), grid, goal_card, starting_card, ALL_DIRECTIONS
+        )
+
+    def test_each_direction_moves_by_its_delta(self):
+        board = self._board(CartaBoard.create_grid(3, 3))
+        expected = {
+            Direction.N: (0, 1),
+            Direction.NW: (0, 0),
+            Direction.NE: (0, 2),
+            Direction.S: (2, 1),
+            Direction.SW: (2, 0),
+            Direction.SE: (2, 2),
+            Direction.E: (1, 2),
+            Direction.W: (1, 0),
+        }
+        for direction in board.allowed_diections:
+            board.player_location = (1, 1)
+            with self.subTest(direction=direction):
+                self.assertEqual(board._new_location(direction), expected[direction])
+                self.assertTrue(board._is_valid_move(direction))
+
+    def test_cannot_move_off_top_or_left_edge(self):
+        board = self._board(CartaBoard.create_grid(3, 3))
+        cases = [
+            ((0, 1), Direction.N),
+            ((0, 1), Direction.NW),
+            ((0, 1), Direction.NE),
+            ((1, 0), Direction.W),
+            ((1, 0), Direction.NW),
+            ((1, 0), Direction.SW),
+            ((0, 0), Direction.NW),
+        ]
+        for location, direction in cases:
+            board.player_location = location
+            with self.subTest(location=location, direction=direction):
+                with self.assertRaises(ValueError):
+                    board._is_valid_move(direction)
+
+    def test_cannot_move_off_bottom_or_right_edge(self):
+        board = self._board(CartaBoard.create_grid(3, 3))
+        cases = [
+            ((2, 1), Direction.S),
+            ((2, 1), Direction.SE),
+            ((2, 1), Direction.SW),
+            ((1, 2), Direction.E),
+            ((1, 2), Direction.NE),
+            ((1, 2), Direction.SE),
+            ((2, 2), Direction.SE),
+        ]
+        for location, direction in cases:
+            board.player_location = location
+            with self.subTest(location=location, direction=direction):
+                with self.assertRaises(ValueError):
+                    board._is_valid_move(direction)
+
+    def test_cannot_move_onto_empty_slot(self):
+        # Occupied: (0, 0), (1, 1), (2, 2).
+        board = self._board(CartaGrid(3, 3, 0b100010001))
+        board.player_location = (1, 1)
+        for direction in (Direction.N, Direction.S, Direction.E, Direction.W):
+            with self.subTest(direction=direction):
+                with self.assertRaises(ValueError):
+                    board._is_valid_move(direction)
+        self.assertTrue(board._is_valid_move(Direction.NW))
+        self.assertTrue(board._is_valid_move(Direction.SE))
+
+
+
+class CartaParseInputTest(unittest.TestCase):
+    def setUp(self):
+        goal_card = PlayingCard(Suit('Hearts'), 2)
+        starting_card = PlayingCard(Suit('Clubs'), 2)
+        self.board = CartaBoard(
+            PlayingCardDeck(aces_high=False), CartaBoard.create_grid(3, 3), goal_card, starting_card
+        )
+
+    def test_input_is_case_insensitive(self):
+        self.assertIs(self.board._parse_input_direction('n'), Direction.N)
+        self.assertIs(self.board._parse_input_direction('W'), Direction.W)
+
+    def test_direction_not_allowed_raises(self):
+        for text in ('ne', 'SW', 'up', ''):
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError):
+                    self.board._parse_input_direction(text)
+
+    def test_quit_exits(self):
+        for text in ('q', 'Quit', 'EXIT'):
+            with self.subTest(text=text):
+                with mock.patch.object(sys, 'exit') as exit, redirect_stdout(io.StringIO()):
+                    self.board._parse_input_direction(text)
+                exit.assert_called_once_with(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
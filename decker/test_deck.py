@@ -0,0 +1,100 @@
+import copy
+import pickle
+import unittest
+
+from deck import Color, PlayingCard, PlayingCardDeck, Suit, shuffle
+
+
+class SuitTest(unittest.TestCase):
+    def test_same_suit_returns_same_instance(self):
+        self.assertIs(Suit('Hearts'), Suit('hearts'))
+        self.assertIs(Suit('Hearts'), Suit('Hearts', color=Color.RED))
+        self.assertIs(Suit(None, 100, Color.RED), Suit(None, 100, Color.RED))
+
+    def test_different_suits_are_different_instances(self):
+        self.assertIsNot(Suit('Hearts'), Suit('Clubs'))
+        self.assertIsNot(Suit('Hearts'), Suit('Hearts', 1))
+        self.assertIsNot(Suit(None, 100, Color.RED), Suit(None, 100, Color.BLACK))
+
+    def test_fields_are_read_only(self):
+        suit = Suit('Spades')
+        for field in ('name', 'value', 'color', 'short_name'):
+            with self.assertRaises(AttributeError):
+                setattr(suit, field, 9)
+        self.assertEqual(Suit('Spades').value, 0)
+
+    def test_copy_returns_interned_suit(self):
+        suit = Suit('Hearts', 2)
+        self.assertIs(copy.copy(suit), suit)
+        self.assertIs(copy.deepcopy(suit), suit)
+
+    def test_pickle_round_trip_returns_interned_suit(self):
+        suit = Suit(None, 100, Color.BLACK)
+        self.assertIs(pickle.loads(pickle.dumps(suit)), suit)
+
+
+class PlayingCardTest(unittest.TestCase):
+    def test_comparisons_use_current_value(self):
+        card = PlayingCard(Suit('Spades'), 3)
+        card.value = 4
+        self.assertEqual(card, PlayingCard(Suit('Spades'), 4))
+        self.assertGreater(card, PlayingCard(Suit('Spades'), 3))
+
+    def test_repr_follows_reassigned_fields(self):
+        card = PlayingCard(Suit('Spades'), 3)
+        card.flip()
+        card.value = 4
+        self.assertEqual(repr(card), '4\u2660')
+        card.suit = Suit('Hearts')
+        self.assertEqual(repr(card), '4\u2665')
+        card.char_value = 'F'
+        self.assertEqual(repr(card), 'F\u2665')
+
+    def test_copy(self):
+        card = PlayingCard(Suit('Hearts'), 5)
+        for copied in (copy.copy(card), copy.deepcopy(card)):
+            self.assertIsNot(copied, card)
+            self.assertEqual(copied, card)
+            self.assertIs(copied.suit, card.suit)
+
+    def test_pickle_round_trip(self):
+        card = PlayingCard(Suit('Hearts'), 12, {12: 'Q'})
+        card.flip()
+        unpickled = pickle.loads(pickle.dumps(card))
+        self.assertEqual(unpickled, card)
+        self.assertIs(unpickled.suit, card.suit)
+        self.assertEqual(repr(unpickled), 'Q♥')
+
+
+class DeckTest(unittest.TestCase):
+    def test_shuffle_keeps_the_same_cards(self):
+        deck = PlayingCardDeck()
+        before = sorted(deck.cards)
+        deck.shuffle()
+        self.assertEqual(sorted(deck.cards), before)
+
+    def test_shuffle_helper_shuffles_lists_in_place(self):
+        lst = list(range(20))
+        shuffle(lst)
+        self.assertEqual(sorted(lst), list(range(20)))
+
+    def test_deal_takes_from_the_top(self):
+        deck = PlayingCardDeck()
+        top = deck.cards[:3]
+        self.assertEqual(deck.deal(3), top)
+        self.assertEqual(len(deck), 49)
+
+    def test_deal_negative_deals_nothing(self):
+        deck = PlayingCardDeck()
+        self.assertEqual(deck.deal(-3), [])
+        self.assertEqual(len(deck), 52)
+
+    def test_deal_more_than_deck_raises(self):
+        deck = PlayingCardDeck()
+        with self.assertRaises(IndexError):
+            deck.deal(53)
+        self.assertEqual(len(deck), 52)
+
+
+if __name__ == '__main__':
+    unittest.main()